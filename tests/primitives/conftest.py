@@ -1,8 +1,17 @@
 import pytest
 
 from zksk.consts import DEFAULT_GROUP
+from zksk.utils import make_generators
 
 
 @pytest.fixture
 def group():
     return DEFAULT_GROUP
+
+
+@pytest.fixture(scope="session")
+def gens():
+    """
+    Generators of the default group, indexed by their number.
+    """
+    return {num: make_generators(num) for num in (2, 4)}
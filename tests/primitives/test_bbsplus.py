@@ -22,6 +22,22 @@ def test_signature_setup():
     assert com.verify_blinding(pk) and signature.verify_signature(pk, messages)
 
 
+def test_signature_verification_fails_on_wrong_messages():
+    mG = BilinearGroupPair()
+    keypair = BBSPlusKeypair.generate(mG, 9)
+    messages = [Bn(30), Bn(31), Bn(32)]
+
+    pk, sk = keypair.pk, keypair.sk
+
+    creator = BBSPlusSignatureCreator(pk)
+    com = creator.commit(messages)
+    presignature = sk.sign(com.com_message)
+    signature = creator.obtain_signature(presignature)
+
+    assert signature.verify_signature(pk, messages)
+    assert not signature.verify_signature(pk, [Bn(30), Bn(31), Bn(33)])
+
+
 def test_signature_proof():
     mG = BilinearGroupPair()
     keypair = BBSPlusKeypair.generate(mG, 9)
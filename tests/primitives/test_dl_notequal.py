@@ -29,6 +29,27 @@ def test_dlne_interactive(group):
     assert verifier.verify(responses)
 
 
+def test_dlne_verifier_view(group):
+    g = group.generator()
+    x = Secret()
+    y = 3 * g
+    y2 = 397474 * g
+    g2 = 1397 * g
+
+    p1 = DLNotEqual([y, g], [y2, g2], x, bind=True)
+    p2 = p1.verifier_view()
+    assert p2 is not p1
+    assert (p2.lhs, p2.g, p2.h, p2.x, p2.bind) == (p1.lhs, p1.g, p1.h, p1.x, p1.bind)
+
+    prover = p1.get_prover({x: 3})
+    verifier = p2.get_verifier()
+    verifier.process_precommitment(prover.precommit())
+    commitment = prover.commit()
+    challenge = verifier.send_challenge(commitment)
+    responses = prover.compute_response(challenge)
+    assert verifier.verify(responses)
+
+
 def test_dlne_non_interactive_1(group):
     g = group.generator()
     x = Secret()
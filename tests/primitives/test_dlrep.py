@@ -193,6 +193,16 @@ def test_get_many_different_provers(group, num):
     assert isinstance(commitment, EcPt)
 
 
+def test_commit_with_int_randomizers(group):
+    g, h = make_generators(2, group)
+    x, y = Secret(), Secret()
+
+    p = DLRep(10 * g + 15 * h, x * g + y * h)
+    prover = p.get_prover({x: 10, y: 15})
+    _, commitment = prover.commit({x: 5, y: 7})
+    assert commitment == 5 * g + 7 * h
+
+
 def test_same_random_values_in_commitments(group):
     (g,) = make_generators(1, group)
     generators = [g, g, g]
@@ -29,54 +29,102 @@ def proof_params(request):
     return secrets, generators
 
 
+@pytest.fixture(scope="module")
+def bbsplus_env():
+    """
+    Bilinear group pair and a BBS+ keypair, shared by all the tests of the module.
+    """
+    mG = BilinearGroupPair()
+    keypair = BBSPlusKeypair.generate(mG, 9)
+    return mG, keypair.pk, keypair.sk
+
+
+@pytest.fixture(scope="module")
+def dlne_bases(bbsplus_env):
+    """
+    Generator of G1 and two random points of G1, to build DLNE statements next to BBS+ proofs.
+    """
+    mG, _, _ = bbsplus_env
+    g1 = mG.G1.generator()
+    order = mG.G1.order()
+    pg2, g2 = order.random() * g1, order.random() * g1
+    return g1, pg2, g2
+
+
+@pytest.fixture(scope="module")
+def messages():
+    return [Bn(30), Bn(31), Bn(32)]
+
+
+@pytest.fixture(scope="module")
+def signatures(bbsplus_env, messages):
+    """
+    Two BBS+ signatures on the messages, issued once for all the tests of the module.
+    """
+    _, pk, sk = bbsplus_env
+    issued = []
+    for _ in range(2):
+        creator = BBSPlusSignatureCreator(pk)
+        lhs = creator.commit(messages)
+        presignature = sk.sign(lhs.com_message)
+        issued.append(creator.obtain_signature(presignature))
+    return tuple(issued)
+
+
+def _make_secret_values(num):
+    # Plain ints rather than big numbers: Secret.__eq__ compares values, and comparing a big
+    # number to the None value of a verifier-side secret does not terminate in petlib.
+    return tuple(range(num))
+
+
+@pytest.fixture(scope="module")
+def gens_lhs(gens):
+    """
+    Left-hand sides :math:`x_i G_i` for the values of :py:func:`get_secrets`, indexed as ``gens``.
+    """
+    return {4: [x * g for x, g in zip(_make_secret_values(4), gens[4])]}
+
+
 def get_secrets(num):
-    secrets = [Secret() for _ in range(num)]
-    secret_values = list(range(num))
-    secret_dict = {x: v for x, v in zip(secrets, secret_values)}
+    """
+    Get fresh secrets with values :math:`0, ..., num - 1`.
+
+    Only the values are shared between the calls. The secrets are new on every call, as provers
+    write the values they are given onto them.
+
+    Tests that tamper with a value through ``prov.subs[i].secret_values`` only modify the copy of
+    that subprover, not the secrets or the returned dictionary.
+    """
+    secrets = tuple(Secret() for _ in range(num))
+    secret_values = _make_secret_values(num)
+    secret_dict = dict(zip(secrets, secret_values))
     return secrets, secret_values, secret_dict
 
 
+def signature_secret_dict(secret_vars, signature, messages):
+    """
+    Map the secrets of a BBS+ signature proof to the values of ``e``, ``s`` and the messages.
+    """
+    return dict(zip(secret_vars, [signature.e, signature.s] + messages))
+
+
 def get_secrets_new(num):
     secrets = [Secret(i * 1337 + i) for i in range(num)]
     return secrets
 
 
 # BBS+ & BBS+
-def test_bbsplus_and_proof():
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
+def test_bbsplus_and_proof(bbsplus_env, messages, signatures):
+    _, pk, _ = bbsplus_env
+    signature, signature2 = signatures
 
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
-
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature2 = sk.sign(lhs.com_message)
-    signature2 = creator.obtain_signature(presignature2)
-    e1, s1, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict2 = {
-        e1: signature2.e,
-        s1: signature2.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e1, s1, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict2 = signature_secret_dict([e1, s1, m1, m2, m3], signature2, messages)
     sigproof1 = BBSPlusSignatureStmt([e1, s1, m1, m2, m3], pk, signature2)
 
     secret_dict.update(secret_dict2)
@@ -88,42 +136,17 @@ def test_bbsplus_and_proof():
 
 
 # BBS+ & BBS+
-def test_and_sig_non_interactive():
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+def test_and_sig_non_interactive(bbsplus_env, messages, signatures):
+    _, pk, _ = bbsplus_env
+    signature, signature2 = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature2 = sk.sign(lhs.com_message)
-    signature2 = creator.obtain_signature(presignature2)
-
-    e1, s1 = (Secret() for _ in range(2))
-    secret_dict2 = {
-        e1: signature2.e,
-        s1: signature2.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e1, s1 = Secret(), Secret()
+    secret_dict2 = signature_secret_dict([e1, s1, m1, m2, m3], signature2, messages)
     sigproof1 = BBSPlusSignatureStmt([e1, s1, m1, m2, m3], pk, signature2)
 
     secret_dict.update(secret_dict2)
@@ -133,34 +156,20 @@ def test_and_sig_non_interactive():
 
 
 # DLNE(BBS+, BBS+)
-def test_signature_and_dlrne():
+def test_signature_and_dlrne(bbsplus_env, messages, signatures, dlne_bases):
     """
     Construct a signature on a set of messages, and then pair the proof of knowledge of this signature with
     a proof of non-equality of two DL, one of which is the blinding exponent 's' of the signature.
     """
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+    _, pk, _ = bbsplus_env
+    signature, _ = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
-    g1 = mG.G1.generator()
+    g1, pg2, g2 = dlne_bases
     pg1 = signature.s * g1
-    pg2, g2 = mG.G1.order().random() * g1, mG.G1.order().random() * g1
     dneq = DLNotEqual((pg1, g1), (pg2, g2), s, bind=True)
     andp = sigproof & dneq
 
@@ -179,36 +188,24 @@ def test_signature_and_dlrne():
 
 
 # DLNE(BBS+, BBS+)
-def test_signature_and_dlrne_fails_on_wrong_secret():
+def test_signature_and_dlrne_fails_on_wrong_secret(
+    bbsplus_env, messages, signatures, dlne_bases
+):
     """
     We manually modify a secret in the DLNE member, i.e we wrongfully claim to use the same "s" i the
     signature and in the DLNE.
     Should be detected and raise an Exception.
     """
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+    _, pk, _ = bbsplus_env
+    signature, _ = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
 
-    g1 = mG.G1.generator()
+    g1, pg2, g2 = dlne_bases
     pg1 = signature.s * g1
-    pg2, g2 = mG.G1.order().random() * g1, mG.G1.order().random() * g1
     dneq = DLNotEqual((pg1, g1), (pg2, g2), s, bind=True)
 
     secrets = [Secret() for _ in range(5)]
@@ -233,35 +230,23 @@ def test_signature_and_dlrne_fails_on_wrong_secret():
 
 
 # DLNE(BBS+, BBS+)
-def test_signature_and_dlrne_does_not_fail_on_wrong_secret_when_non_binding():
+def test_signature_and_dlrne_does_not_fail_on_wrong_secret_when_non_binding(
+    bbsplus_env, messages, signatures, dlne_bases
+):
     """
     Manually modify a secret in the DLNE member, i.e we wrongfully claim to use the same "s" i the
     signature and in the DLNE.  Should not be detected since bindings in the DLNE are False.
     """
 
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+    _, pk, _ = bbsplus_env
+    signature, _ = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
 
-    g1 = mG.G1.generator()
+    g1, pg2, g2 = dlne_bases
     pg1 = signature.s * g1 + g1
-    pg2, g2 = mG.G1.order().random() * g1, mG.G1.order().random() * g1
     splus = Secret(signature.s + 1)
     dneq = DLNotEqual((pg1, g1), (pg2, g2), splus, bind=False)
 
@@ -285,42 +270,17 @@ def test_signature_and_dlrne_does_not_fail_on_wrong_secret_when_non_binding():
 
 
 # BBS+ | BBS+
-def test_or_signature_non_interactive():
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+def test_or_signature_non_interactive(bbsplus_env, messages, signatures):
+    _, pk, _ = bbsplus_env
+    signature, signature2 = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature2 = sk.sign(lhs.com_message)
-    signature2 = creator.obtain_signature(presignature2)
-
-    e1, s1 = (Secret() for _ in range(2))
-    secret_dict2 = {
-        e1: signature2.e,
-        s1: signature2.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e1, s1 = Secret(), Secret()
+    secret_dict2 = signature_secret_dict([e1, s1, m1, m2, m3], signature2, messages)
     sigproof1 = BBSPlusSignatureStmt([e1, s1, m1, m2, m3], pk, signature2)
 
     secret_dict.update(secret_dict2)
@@ -329,40 +289,17 @@ def test_or_signature_non_interactive():
     assert andp.verify(tr)
 
 
-# BBS+ | BBS+
-def test_or_signature_non_interactive():
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+# (BBS+ | BBS+) | BBS+
+def test_nested_or_signature_non_interactive(bbsplus_env, messages, signatures):
+    _, pk, _ = bbsplus_env
+    signature, signature2 = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature2 = sk.sign(lhs.com_message)
-    signature2 = creator.obtain_signature(presignature2)
-
-    e1, s1 = (Secret() for _ in range(2))
-    secret_dict2 = {
-        e1: signature2.e,
-        s1: signature2.s,
-        m1: messages[0],
-        m2: messages[1],
-    }
+
+    e1, s1 = Secret(), Secret()
+    secret_dict2 = signature_secret_dict([e1, s1, m1, m2, m3], signature2, messages)
     sigproof1 = BBSPlusSignatureStmt([e1, s1, m1, m2, m3], pk, signature2)
 
     secret_dict.update(secret_dict2)
@@ -373,34 +310,20 @@ def test_or_signature_non_interactive():
 
 
 # BBS+ | DLNE
-def test_signature_or_dlrne():
+def test_signature_or_dlrne(bbsplus_env, messages, signatures, dlne_bases):
     """
     Construct a signature on a set of messages, and then pairs the proof of knowledge of this signature with
     a proof of non-equality of two DL, one of which is the blinding exponent 's' of the signature.
     """
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-    messages = [Bn(30), Bn(31), Bn(32)]
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+    _, pk, _ = bbsplus_env
+    signature, _ = signatures
 
-    creator = BBSPlusSignatureCreator(pk)
-    lhs = creator.commit(messages)
-    presignature = sk.sign(lhs.com_message)
-    signature = creator.obtain_signature(presignature)
-    e, s, m1, m2, m3 = (Secret() for _ in range(5))
-    secret_dict = {
-        e: signature.e,
-        s: signature.s,
-        m1: messages[0],
-        m2: messages[1],
-        m3: messages[2],
-    }
+    e, s, m1, m2, m3 = Secret(), Secret(), Secret(), Secret(), Secret()
+    secret_dict = signature_secret_dict([e, s, m1, m2, m3], signature, messages)
 
     sigproof = BBSPlusSignatureStmt([e, s, m1, m2, m3], pk, signature)
-    g1 = mG.G1.generator()
+    g1, pg2, g2 = dlne_bases
     pg1 = signature.s * g1
-    pg2, g2 = mG.G1.order().random() * g1, mG.G1.order().random() * g1
     dneq = DLNotEqual((pg1, g1), (pg2, g2), s, bind=True)
     andp = sigproof | dneq
 
@@ -419,11 +342,30 @@ def test_signature_or_dlrne():
 
 
 # DLNE & DLNE
-def test_and_dlrne():
-    secrets, secret_values, secret_dict = get_secrets(3)
-    generators = make_generators(3)
-
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+@pytest.mark.parametrize(
+    "rhs_value_idx,rhs_base_idx,secret_idx,bind,mutated_value_idx,valid",
+    [
+        pytest.param(2, 2, 1, False, None, True, id="valid"),
+        # Second subproof is not correct as the two members have the same DL.
+        pytest.param(1, 3, 1, False, None, False, id="same-dl"),
+        # Claim to use (H0 = h0*x, H1 != h1*x), (H1 = h1*x, H3 != h3*x) with the same x (not
+        # only cheating, a contradiction). Should be detected as binding is on.
+        pytest.param(2, 3, 0, True, 1, False, id="contradiction-when-binding"),
+    ],
+)
+def test_and_dlrne(
+    gens,
+    gens_lhs,
+    rhs_value_idx,
+    rhs_base_idx,
+    secret_idx,
+    bind,
+    mutated_value_idx,
+    valid,
+):
+    secrets, secret_values, secret_dict = get_secrets(4)
+    generators, lhs_values = gens[4], gens_lhs[4]
+    rhs_base = generators[rhs_base_idx]
     p1 = DLNotEqual(
         [lhs_values[0], generators[0]],
         [lhs_values[1], generators[1]],
@@ -431,66 +373,32 @@ def test_and_dlrne():
         bind=True,
     )
     p2 = DLNotEqual(
-        [lhs_values[1], generators[1]], [lhs_values[2], generators[2]], secrets[1]
-    )
-    andp = p1 & p2
-
-    p1_prime = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
-    p2_prime = DLNotEqual(
-        [lhs_values[1], generators[1]], [lhs_values[2], generators[2]], secrets[1]
-    )
-
-    andp_prime = p1_prime & p2_prime
-    protocol = SigmaProtocol(andp_prime.get_verifier(), andp.get_prover(secret_dict))
-    assert protocol.verify()
-
-
-# DLNE & DLNE
-def test_and_dlrne_fails_on_same_dl():
-    """
-    Second subproof is not correct as the two members have the same DL
-    """
-    secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
-    y3 = secret_values[1] * generators[3]
-    p1 = DLNotEqual(
-        [lhs_values[0], generators[0]],
         [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
+        [secret_values[rhs_value_idx] * rhs_base, rhs_base],
+        secrets[secret_idx],
+        bind=bind,
     )
-    p2 = DLNotEqual([lhs_values[1], generators[1]], [y3, generators[3]], secrets[1])
-
     andp = p1 & p2
-    p1_prime = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
+    andp_prime = p1.verifier_view() & p2.verifier_view()
 
-    p2_prime = DLNotEqual(
-        [lhs_values[1], generators[1]], [y3, generators[3]], secrets[1]
-    )
+    prov = andp.get_prover(secret_dict)
+    if mutated_value_idx is not None:
+        prov.subs[1].secret_values[secrets[secret_idx]] = secret_values[
+            mutated_value_idx
+        ]
 
-    andp_prime = p1_prime & p2_prime
-    protocol = SigmaProtocol(andp_prime.get_verifier(), andp.get_prover(secret_dict))
-    with pytest.raises(ValidationError):
-        protocol.verify()
+    protocol = SigmaProtocol(andp_prime.get_verifier(), prov)
+    if valid:
+        assert protocol.verify()
+    else:
+        with pytest.raises(ValidationError):
+            protocol.verify()
 
 
 # DLREP & DLNE
-def test_and_dlrne_binding_1():
+def test_and_dlrne_binding_1(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     p1 = DLNotEqual(
         [lhs_values[0], generators[0]],
@@ -501,28 +409,21 @@ def test_and_dlrne_binding_1():
     p2 = DLRep(lhs_values[0], secrets[0] * generators[0])
     andp = p1 & p2
 
-    p1_prime = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
     p2_prime = DLRep(lhs_values[0], Secret(name=secrets[0].name) * generators[0])
-    andp_prime = p1_prime & p2_prime
+    andp_prime = p1.verifier_view() & p2_prime
 
     protocol = SigmaProtocol(andp_prime.get_verifier(), andp.get_prover(secret_dict))
     assert protocol.verify()
 
 
 # DLREP & DLNE
-def test_and_dlrne_does_not_fail_on_same_dl_when_not_binding():
+def test_and_dlrne_does_not_fail_on_same_dl_when_not_binding(gens, gens_lhs):
     """
     Prove (H0 = h0*x, H1 != h1*x), H2 = h2*x with same secret name x. Should not be detected as
     binding is off by default.
     """
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     s0 = secrets[0]
@@ -546,14 +447,13 @@ def test_and_dlrne_does_not_fail_on_same_dl_when_not_binding():
 
 
 # DLREP & DLNE
-def test_dlrep_and_dlrne_fails_on_same_dl_when_binding():
+def test_dlrep_and_dlrne_fails_on_same_dl_when_binding(gens, gens_lhs):
     """
     Prove (H0 = h0*x, H1 != h1*x), H2 = h2*x with same secret name x. Should be detected as
     binding is on.
     """
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -590,54 +490,13 @@ def test_dlrep_and_dlrne_fails_on_same_dl_when_binding():
 
 
 # DLNE & DLNE
-def test_and_dlrne_fails_on_contradiction_when_binding():
-    """
-    Claim to use (H0 = h0*x, H1 != h1*x), (H1 = h1*x, H3 != h3*x) with the same x (not only
-    cheating, a contradiction). Should be detected as binding is on.
-    """
-    secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
-
-    y3 = secret_values[2] * generators[3]
-    p1 = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
-    p2 = DLNotEqual(
-        [lhs_values[1], generators[1]], [y3, generators[3]], secrets[0], bind=True
-    )
-    andp = p1 & p2
-
-    p1_prime = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
-    p2_prime = DLNotEqual(
-        [lhs_values[1], generators[1]], [y3, generators[3]], secrets[0], bind=True
-    )
-    andp_prime = p1_prime & p2_prime
-
-    prov = andp.get_prover(secret_dict)
-    prov.subs[1].secret_values[secrets[0]] = secret_values[1]
-
-    protocol = SigmaProtocol(andp_prime.get_verifier(), prov)
-    with pytest.raises(ValidationError):
-        protocol.verify()
-
-
-# DLNE & DLNE
-def test_and_dlrep_partial_binding():
+def test_and_dlrep_partial_binding(gens):
     """
     Claim to use (H0 = h0*x, H1 != h1*x) , (H1 = h1*x, H3 != h3*x) with the same x (not only
     cheating, a contradiction).  Should be undetected as binding is off in at least one proof
     """
     secrets = get_secrets_new(4)
-    generators = make_generators(4)
+    generators = gens[4]
     lhs_values = [x.value * g for x, g in zip(secrets, generators)]
 
     y3 = secrets[2].value * generators[3]
@@ -669,9 +528,9 @@ def test_and_dlrep_partial_binding():
 
 
 # DLNE & DLREP & DLNE & DLNE
-def test_multiple_and_dlrep_binding():
+def test_multiple_and_dlrep_binding(gens):
     secrets = get_secrets_new(4)
-    generators = make_generators(4)
+    generators = gens[4]
     lhs_values = [x.value * g for x, g in zip(secrets, generators)]
 
     p1 = DLNotEqual(
@@ -718,10 +577,9 @@ def test_multiple_and_dlrep_binding():
 
 
 # DLNE & DLREP & DLNE & DLNE
-def test_multiple_and_dlrep_fails_on_bad_secret_when_binding():
+def test_multiple_and_dlrep_fails_on_bad_secret_when_binding(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     p1 = DLNotEqual(
         [lhs_values[0], generators[0]],
@@ -746,28 +604,8 @@ def test_multiple_and_dlrep_fails_on_bad_secret_when_binding():
 
     andp = p1 & p2 & p3 & p4
 
-    p11 = DLNotEqual(
-        [lhs_values[0], generators[0]],
-        [lhs_values[1], generators[1]],
-        secrets[0],
-        bind=True,
-    )
     p21 = DLRep(lhs_values[0], secrets[0] * generators[0])
-
-    p31 = DLNotEqual(
-        [lhs_values[2], generators[2]],
-        [lhs_values[1], generators[1]],
-        secrets[2],
-        bind=True,
-    )
-    p41 = DLNotEqual(
-        [lhs_values[1], generators[1]],
-        [lhs_values[3], generators[3]],
-        secrets[0],
-        bind=True,
-    )
-
-    andp1 = p11 & p21 & p31 & p41
+    andp1 = p1.verifier_view() & p21 & p3.verifier_view() & p4.verifier_view()
 
     prov = andp.get_prover(secret_dict)
     prov.subs[1].secret_values[secrets[0]] = secret_values[1]
@@ -793,10 +631,9 @@ def test_and_dlrne_non_interactive_1(group):
 
 
 # DLNE & DLNE & DLREP
-def test_and_dlrne_non_interactive_2():
+def test_and_dlrne_non_interactive_2(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     p1 = DLNotEqual(
         [lhs_values[0], generators[0]],
@@ -833,10 +670,9 @@ def test_and_dlrne_non_interactive_2():
 
 
 # DLNE & DLREP & DLNE & DLNE
-def test_multiple_dlrne_simulation():
+def test_multiple_dlrne_simulation(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     p1 = DLNotEqual(
         [lhs_values[0], generators[0]],
@@ -866,10 +702,9 @@ def test_multiple_dlrne_simulation():
 
 
 # DLNE & DLNE
-def test_dlrne_simulation_binding():
+def test_dlrne_simulation_binding(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -886,10 +721,9 @@ def test_dlrne_simulation_binding():
 
 
 # DLNE | DLNE
-def test_or_dlrne():
+def test_or_dlrne(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -911,10 +745,9 @@ def test_or_dlrne():
 
 
 # DLNE | DLNE
-def test_or_dlrne_non_interactive():
+def test_or_dlrne_non_interactive(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -932,10 +765,9 @@ def test_or_dlrne_non_interactive():
 
 
 # (DLNE | DLNE) | DLNE | DLNE
-def test_or_or_dlrne():
+def test_or_or_dlrne(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -965,10 +797,9 @@ def test_or_or_dlrne():
 
 
 # (DLNE & DLNE) | DLNE | DLNE
-def test_or_and_dlrne():
+def test_or_and_dlrne(gens, gens_lhs):
     secrets, secret_values, secret_dict = get_secrets(4)
-    generators = make_generators(4)
-    lhs_values = [x * g for x, g in zip(secret_values, generators)]
+    generators, lhs_values = gens[4], gens_lhs[4]
 
     y3 = secret_values[2] * generators[3]
     p1 = DLNotEqual(
@@ -993,8 +824,8 @@ def test_or_and_dlrne():
 
 
 # DLRep | Range
-def test_dlrep_or_rangeproof(group):
-    g, h = make_generators(2)
+def test_dlrep_or_rangeproof(group, gens):
+    g, h = gens[2]
 
     x = Secret(9)
     y = Secret(42)
@@ -1012,12 +843,8 @@ def test_dlrep_or_rangeproof(group):
 
 
 # BBS+ & Range
-def test_bbsplus_and_rangeproof():
-    mG = BilinearGroupPair()
-    keypair = BBSPlusKeypair.generate(mG, 9)
-
-    pk, sk = keypair.pk, keypair.sk
-    generators, h0 = keypair.generators, keypair.h0
+def test_bbsplus_and_rangeproof(bbsplus_env):
+    mG, pk, sk = bbsplus_env
 
     creator = BBSPlusSignatureCreator(pk)
     msg_val = Bn(30)
@@ -252,6 +252,39 @@ def test_or_proof(params):
     assert verif.verify(resp)
 
 
+def test_or_proof_fails_on_wrong_response(params, group):
+    p1, p2, secrets = params
+    orproof = OrProofStmt(p1, p2)
+    prov = orproof.get_prover(secrets)
+    verif = orproof.get_verifier()
+    com = prov.commit()
+    chal = verif.send_challenge(com)
+    challenges, responses = prov.compute_response(chal)
+
+    # Tamper with a response of the subproof with the most bases, which is checked last.
+    responses[1][0] = (responses[1][0] + 1) % group.order()
+    assert not verif.verify((challenges, responses))
+
+
+def test_or_proof_checks_cheap_subproof_first(params, group, monkeypatch):
+    p1, p2, secrets = params
+    orproof = OrProofStmt(p1, p2)
+    prov = orproof.get_prover(secrets)
+    verif = orproof.get_verifier()
+    com = prov.commit()
+    chal = verif.send_challenge(com)
+    challenges, responses = prov.compute_response(chal)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The most expensive subproof should not be checked.")
+
+    monkeypatch.setattr(orproof.subproofs[1], "recompute_commitment", fail)
+
+    # Tamper with a response of the subproof with the fewest bases, which is checked first.
+    responses[0][0] = (responses[0][0] + 1) % group.order()
+    assert not verif.verify((challenges, responses))
+
+
 def test_or_proof_manual(params):
     """
     TODO: Clarify what is being tested here.
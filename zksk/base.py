@@ -79,16 +79,13 @@ def build_fiat_shamir_challenge(stmt_prehash, *args, message=""):
         args: Items to hash (e.g., commitments)
         message: Message to make it a signature PK.
     """
-    # Start building the complete hash for the challenge
-    for elem in args:
-        if not isinstance(elem, bytes) and not isinstance(elem, str):
-            encoded = encode(elem)
-        else:
-            encoded = elem
-        stmt_prehash.update(encoded)
-
-    stmt_prehash.update(message.encode())
-    return Bn.from_hex(stmt_prehash.hexdigest())
+    # Serialize all the items first, and complete the hash for the challenge in a single update
+    parts = [
+        elem if isinstance(elem, (bytes, str)) else encode(elem) for elem in args
+    ]
+    parts.append(message.encode())
+    stmt_prehash.update(b"".join(parts))
+    return Bn.from_binary(stmt_prehash.digest())
 
 
 class Prover(metaclass=abc.ABCMeta):
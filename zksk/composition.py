@@ -39,6 +39,21 @@ def _find_residual_challenge(subchallenges, challenge, modulus):
     return -sum_bn_array(temp_arr, modulus)
 
 
+def _check_or_challenges(subchallenges, challenge):
+    """
+    Check that the subchallenges of an or-proof add up to the global challenge.
+
+    Args:
+        subchallenges: The subchallenges, one per subproof.
+        challenge: The global challenge.
+
+    Raises:
+        InconsistentChallengeError: If the subchallenges do not add up to the challenge.
+    """
+    if _find_residual_challenge(subchallenges, challenge, CHALLENGE_LENGTH) != Bn(0):
+        raise InconsistentChallengeError("Inconsistent challenges.")
+
+
 def _assign_secret_ids(secret_vars):
     """
     Assign consecutive identifiers to secrets.
@@ -422,10 +437,7 @@ class OrProofStmt(_CommonComposedStmtMixin, ComposableProofStmt):
         responses = responses[1]
 
         # We check for challenge consistency i.e the constraint was respected
-        if _find_residual_challenge(
-            self.or_challenges, challenge, CHALLENGE_LENGTH
-        ) != Bn(0):
-            raise InconsistentChallengeError("Inconsistent challenges.")
+        _check_or_challenges(self.or_challenges, challenge)
 
         # Compute the list of commitments, one for each proof with its challenge and responses
         # (in-order)
@@ -683,6 +695,41 @@ class OrVerifier(Verifier):
         for index, sub in enumerate(self.subs):
             sub.process_precommitment(precommitment[index])
 
+    def verify(self, responses, *args, **kwargs):
+        """
+        Verify the responses of an interactive or-proof.
+
+        Recomputes the commitment of one subproof at a time, starting from the subproofs with the
+        fewest bases, so that an invalid proof is rejected before the most expensive subproofs are
+        recomputed. This only applies to a top-level interactive or-proof: an or-proof nested in
+        another composition is checked through :py:meth:`OrProofStmt.recompute_commitment`, which
+        recomputes all the subproofs.
+
+        Args:
+            responses: a tuple (subchallenges, actual_responses).
+
+        Returns:
+            bool: True if verification succeeded, False otherwise.
+        """
+        self.pre_verification_validation(responses, *args, **kwargs)
+
+        or_challenges, sub_responses = responses
+        _check_or_challenges(or_challenges, self.challenge)
+
+        subproofs = self.stmt.subproofs
+        if len(self.commitment) != len(subproofs):
+            return False
+        by_cost = sorted(
+            range(len(subproofs)), key=lambda index: len(subproofs[index].get_bases())
+        )
+        for index in by_cost:
+            commitment = subproofs[index].recompute_commitment(
+                or_challenges[index], sub_responses[index]
+            )
+            if self.commitment[index] != commitment:
+                return False
+        return True
+
     def check_responses_consistency(self, responses, responses_dict=None):
         """
         Checks that for a same secret, response are actually the same.
@@ -101,6 +101,9 @@ class Secret:
         value: Optional secret value.
     """
 
+    # Proofs create many secrets, so we avoid a per-instance __dict__.
+    __slots__ = ("name", "value")
+
     # Number of bytes in a randomly-generated name of a secret.
     NUM_NAME_BYTES = 8
 
@@ -49,6 +49,7 @@ class GTGroup:
         self.bp = bp
         self.gen = None
         self.inf = None
+        self.ord = None
 
     def infinite(self):
         if self.inf is None:
@@ -56,7 +57,9 @@ class GTGroup:
         return self.inf
 
     def order(self):
-        return self.bp.bpgp.order()
+        if self.ord is None:
+            self.ord = self.bp.bpgp.order()
+        return self.ord
 
     def generator(self):
         if self.gen is None:
@@ -64,16 +67,19 @@ class GTGroup:
         return self.gen
 
     def sum(self, points):
-        res = self.infinite()
+        res = self.infinite().pt
         for p in points:
-            res = res + p
-        return res
+            res = res * p.pt
+        return AdditivePoint(res, self.bp)
 
     def wsum(self, weights, generators):
-        res = self.infinite()
+        # Work on the underlying points to avoid wrapping every intermediate result.
+        res = self.infinite().pt
         for w, g in zip(weights, generators):
-            res = res + w * g
-        return res
+            # Skip zero weights, as the underlying bplib function is broken for this value.
+            if w != 0:
+                res = res * (g.pt ** w)
+        return AdditivePoint(res, self.bp)
 
 
 # TODO: Why should this not just be called GTPoint?
@@ -211,6 +217,7 @@ class G1Group:
         self.bp = bp
         self.gen = None
         self.inf = None
+        self.ord = None
 
     def generator(self):
         if self.gen is None:
@@ -223,7 +230,9 @@ class G1Group:
         return self.inf
 
     def order(self):
-        return self.bp.bpgp.order()
+        if self.ord is None:
+            self.ord = self.bp.bpgp.order()
+        return self.ord
 
     def __eq__(self, other):
         return self.bp.bpgp == other.bp.bpgp and self.__class__ == other.__class__
@@ -233,17 +242,18 @@ class G1Group:
 
     # TODO throw these on a base class
     def sum(self, points):
-        res = self.infinite()
+        res = self.infinite().pt
         for p in points:
-            res = res + p
-        return res
+            res = res + p.pt
+        return G1Point(res, self.bp)
 
     # TODO throw these on a base class
     def wsum(self, weights, generators):
-        res = self.infinite()
+        # Work on the underlying points to avoid wrapping every intermediate result.
+        res = self.infinite().pt
         for w, g in zip(weights, generators):
-            res = res + w * g
-        return res
+            res = res + g.pt * w
+        return G1Point(res, self.bp)
 
 
 class G2Group:
@@ -259,6 +269,7 @@ class G2Group:
         self.bp = bp
         self.gen = None
         self.inf = None
+        self.ord = None
 
     def generator(self):
         if self.gen is None:
@@ -271,20 +282,23 @@ class G2Group:
         return self.inf
 
     def order(self):
-        return self.bp.bpgp.order()
+        if self.ord is None:
+            self.ord = self.bp.bpgp.order()
+        return self.ord
 
     # TODO throw these on a base class
     def sum(self, points):
-        res = self.infinite()
+        res = self.infinite().pt
         for p in points:
-            res = res + p
-        return res
+            res = res + p.pt
+        return G2Point(res, self.bp)
 
     def wsum(self, weights, generators):
-        res = self.infinite()
+        # Work on the underlying points to avoid wrapping every intermediate result.
+        res = self.infinite().pt
         for w, g in zip(weights, generators):
-            res = res + w * g
-        return res
+            res = res + g.pt * w
+        return G2Point(res, self.bp)
 
 
 def pt_enc(obj):
@@ -37,7 +37,9 @@ class BBSPlusSignature:
         product = generators[0] + generators[0].group.wsum(
             ([self.s] + messages), generators[1:]
         )
-        return self.A.pair(pk.w + self.e * pk.h0) == product.pair(pk.h0)
+        # Check e(A, w + e h0) = e(product, h0) as e(A, w) = e(product - e A, h0), so that the
+        # multiplication by e is done in G1 rather than in G2.
+        return self.A.pair(pk.w) == (product - self.e * self.A).pair(pk.h0)
 
 
 @attr.s
@@ -169,7 +171,10 @@ class BBSPlusPublicKey:
     """
     BBS+ public key.
 
-    Automatically pre-computes the generator pairings :math:`e(g_i, h_0)`.
+    Pre-computes the generator pairings :math:`e(g_i, h_0)` and :math:`e(g_2, w)`, which do not
+    depend on the signature, as well as :math:`-h_0` and :math:`-e(g_0, h_0)` so that the proof
+    statements do not have to invert elements of GT. Each of these is computed on first use, and
+    reused by all the following proofs with this key.
     """
 
     w = attr.ib()
@@ -177,8 +182,47 @@ class BBSPlusPublicKey:
     generators = attr.ib()
 
     def __attrs_post_init__(self):
-        """Pre-compute the group pairings."""
-        self.gen_pairs = [g.pair(self.h0) for g in self.generators]
+        self._gen_pairs = [None] * len(self.generators)
+        self._w_pair = None
+        self._neg_h0 = None
+        self._neg_gen_pair = None
+
+    def gen_pair(self, index):
+        """Get the pairing :math:`e(g_i, h_0)` of the generator with the given index."""
+        if self._gen_pairs[index] is None:
+            self._gen_pairs[index] = self.generators[index].pair(self.h0)
+        return self._gen_pairs[index]
+
+    @property
+    def gen_pairs(self):
+        """
+        Get the pairings :math:`e(g_i, h_0)` of all the generators.
+
+        Computes every pairing that is not cached yet, so prefer :py:meth:`gen_pair` when only some
+        of the generators are needed.
+        """
+        return [self.gen_pair(index) for index in range(len(self.generators))]
+
+    @property
+    def w_pair(self):
+        """Get the pairing :math:`e(g_2, w)`."""
+        if self._w_pair is None:
+            self._w_pair = self.generators[2].pair(self.w)
+        return self._w_pair
+
+    @property
+    def neg_h0(self):
+        """Get :math:`-h_0`."""
+        if self._neg_h0 is None:
+            self._neg_h0 = -1 * self.h0
+        return self._neg_h0
+
+    @property
+    def neg_gen_pair(self):
+        """Get :math:`-e(g_0, h_0)`."""
+        if self._neg_gen_pair is None:
+            self._neg_gen_pair = -1 * self.gen_pair(0)
+        return self._neg_gen_pair
 
 
 @attr.s
@@ -272,7 +316,7 @@ class BBSPlusSignatureStmt(ExtendedProofStmt):
         self.delta2.value = r2 * self.signature.e % self.order
 
         precommitment = {}
-        precommitment["A1"] = r1 * self.bases[1] + r2 * self.bases[2]
+        precommitment["A1"] = self.bases[1].group.wsum([r1, r2], self.bases[1:3])
         precommitment["A2"] = r1 * self.bases[2] + self.signature.A
 
         return precommitment
@@ -294,13 +338,13 @@ class BBSPlusSignatureStmt(ExtendedProofStmt):
             self.delta1 * g1 + self.delta2 * g2 + self.secret_vars[0] * (-1 * self.A1),
         )
 
-        self.pair_lhs = self.A2.pair(self.pk.w) + (-1 * self.pk.gen_pairs[0])
+        self.pair_lhs = self.A2.pair(self.pk.w) + self.pk.neg_gen_pair
         bases = [
-            -1 * (self.A2.pair(self.pk.h0)),
-            self.bases[2].pair(self.pk.w),
-            self.pk.gen_pairs[2],
+            self.A2.pair(self.pk.neg_h0),
+            self.pk.w_pair,
+            self.pk.gen_pair(2),
         ]
-        bases.extend(self.pk.gen_pairs[1 : len(self.bases)])
+        bases.extend(self.pk.gen_pair(i) for i in range(1, len(self.bases)))
 
         # Build secret names [e, r1, delta1, s, m_i]
         new_secret_vars = (
@@ -60,6 +60,21 @@ class DLNotEqual(ExtendedProofStmt):
         self.bind = bind
         self.set_simulated(simulated)
 
+    def verifier_view(self):
+        """
+        Get a statement with the same public inputs, secret, and binding, e.g., for the verifier.
+
+        The pairs are shared with this statement rather than copied. The internal secrets are
+        fresh, so that the two statements can be used on the two sides of a proof.
+        """
+        return self.__class__(
+            [self.lhs[0], self.g],
+            [self.lhs[1], self.h],
+            self.x,
+            bind=self.bind,
+            simulated=self.simulated,
+        )
+
     def precommit(self):
         """Build the left-hand side of the internal proof statement."""
         order = self.g.group.order()
@@ -18,7 +18,7 @@ from petlib.bn import Bn
 
 from zksk.base import Verifier, Prover, SimulationTranscript
 from zksk.expr import Secret, Expression
-from zksk.utils import get_random_num
+from zksk.utils import get_random_num, ensure_bn
 from zksk.consts import CHALLENGE_LENGTH
 from zksk.composition import ComposableProofStmt
 from zksk.exceptions import IncompleteValuesError, InvalidExpression
@@ -217,15 +217,10 @@ class DLRepProver(Prover):
         randomizers_dict = self.stmt.update_randomizers(randomizers_dict)
 
         # Compute an ordered list of randomizers mirroring the Secret objects
-        self.ks = [randomizers_dict[sec] for sec in self.stmt.secret_vars]
-        subcommits = [a * b for a, b in zip(self.ks, self.stmt.bases)]
+        self.ks = [ensure_bn(randomizers_dict[sec]) for sec in self.stmt.secret_vars]
 
-        # We build the commitment doing the product k0 * g0 + k1 * g1...
-        result = self.stmt.bases[0].group.infinite()
-        for com in subcommits:
-            result = result + com
-
-        return result
+        # We build the commitment k0 * g0 + k1 * g1... as a single multi-scalar multiplication
+        return self.stmt.bases[0].group.wsum(self.ks, self.stmt.bases)
 
     def compute_response(self, challenge):
         """
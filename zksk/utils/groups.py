@@ -94,15 +94,18 @@ def sum_bn_array(arr, modulus):
     >>> m = 10
     >>> sum_bn_array(a, m)
     2
+    >>> sum_bn_array([Bn(5), Bn(-7)], m)
+    8
     """
     if not isinstance(modulus, Bn):
         modulus = Bn(modulus)
+    # Big numbers do not overflow, so we only reduce once at the end.
     res = Bn(0)
     for elem in arr:
         if not isinstance(elem, Bn):
             elem = Bn(elem)
-        res = res.mod_add(elem, modulus)
-    return res
+        res = res + elem
+    return res % modulus
 
 
 def ensure_bn(x):